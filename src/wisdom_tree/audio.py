@@ -1,45 +1,75 @@
+import curses
+import curses.textpad
 import logging
+import queue
 import re
 import time
-import urllib.request
+from collections.abc import Iterable
 from typing import Any
+from urllib.error import HTTPError, URLError
 
 import requests
 import vlc
 from pytubefix import YouTube
+from pytubefix.exceptions import PytubeFixError
+from requests.adapters import HTTPAdapter
 
 from wisdom_tree.config import (
     ALARM_SOUND,
     EFFECT_VOLUME,
     SOUNDS_MUTED,
+    STREAM_URL_TTL_SECS,
+    YOUTUBE_ATTEMPTS,
+    YOUTUBE_BACKOFF_SECS,
 )
 
-YOUTUBE_REGEX = re.compile(r'^(https?\:\/\/)?(www\.)?(youtube\.com|youtu\.be)\/.+$')
+logger = logging.getLogger(__name__)
 
+VIDEO_ID_REGEX = re.compile(rb'watch\?v=(\S{11})')
+URL_VIDEO_ID_REGEX = re.compile(r'(?:v=|youtu\.be/|shorts/)([\w-]{11})')
+
+_VLC_INSTANCE = vlc.Instance('--quiet')
+_SFX_PLAYERS: dict[str, Any] = {}
+# video id -> (expiry as time.monotonic(), stream url, title); worker thread only
+_STREAM_CACHE: dict[str, tuple[float, str, str]] = {}
+
+# Shared so consecutive searches reuse one keep-alive connection
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+
+def _sound_player(sound: str) -> Any:
+    # One reusable player per effect, so replaying does not re-create libVLC objects
+    player = _SFX_PLAYERS.get(sound)
+    if player is None:
+        player = _VLC_INSTANCE.media_player_new()
+        player.set_media(_VLC_INSTANCE.media_new(sound))
+        _SFX_PLAYERS[sound] = player
+    return player
 
-def is_internet_available() -> bool:
-    try:
-        urllib.request.urlopen('https://youtube.com', timeout=10)
-        return True
-    except Exception:
-        return False
+
+def preload_sounds(sounds: Iterable[str]) -> None:
+    # Open every effect up front so the first play has no setup latency
+    for sound in sounds:
+        _sound_player(sound)
 
 
 def play_sound(sound: str) -> None:
     if SOUNDS_MUTED and sound != ALARM_SOUND:
         return
     try:
-        media = vlc.MediaPlayer(sound)
-        media.audio_set_volume(EFFECT_VOLUME)
-        media.play()
+        player = _sound_player(sound)
+        player.stop()
+        player.audio_set_volume(EFFECT_VOLUME)
+        player.play()
     except Exception as e:
-        logging.error('Error playing sound: %s', e)
+        logger.error('Error playing sound: %s', e)
 
 
 def toggle_sounds() -> None:
     global SOUNDS_MUTED
     SOUNDS_MUTED = not SOUNDS_MUTED
-    logging.info('Sound toggled, muted: %s', SOUNDS_MUTED)
+    logger.info('Sound toggled, muted: %s', SOUNDS_MUTED)
 
 
 def get_youtube_links(search_string: str) -> str:
@@ -47,61 +77,147 @@ def get_youtube_links(search_string: str) -> str:
         'https://www.youtube.com/results?search_query='
         + search_string.replace(' ', '+')
     )
-    html = requests.get(search_url, timeout=15)
-    video_ids = re.findall(r'watch\?v=(\S{11})', html.content.decode())
-    return 'http://youtube.com/watch?v=' + str(video_ids[0])
+    # Stream the results page and stop at the first video id instead of
+    # downloading the whole (multi-MB) page.
+    tail = b''
+    with _HTTP_SESSION.get(search_url, stream=True, timeout=15) as response:
+        for chunk in response.iter_content(chunk_size=65536):
+            data = tail + chunk
+            match = VIDEO_ID_REGEX.search(data)
+            if match:
+                return 'http://youtube.com/watch?v=' + match.group(1).decode()
+            # Keep enough of the end to catch an id split across chunks
+            tail = data[-32:]
+    raise ValueError('No videos found for the search.')
 
 
 def adjust_media_volume(tree_instance: Any, new_volume: int, maxx: int) -> None:
-    tree_instance.media.audio_set_volume(max(0, min(100, new_volume)))
-    tree_instance.notifyendtime = int(time.time()) + 2
-    volume_str = f'{round(new_volume)}%'
-    tree_instance.notifystring = (
-        ' ' * round(maxx * (new_volume / 100) - len(volume_str) - 2) + volume_str
-    )
-    tree_instance.invert = True
-    tree_instance.isnotify = True
+    new_volume = max(0, min(100, new_volume))
+    tree_instance.media_player.media.audio_set_volume(new_volume)
+    tree_instance.notifications.notify_bar(f'{new_volume}%', new_volume, 100, maxx)
+
+
+def adjust_effect_volume(delta: int) -> int:
+    global EFFECT_VOLUME
+    EFFECT_VOLUME = max(0, min(100, EFFECT_VOLUME + delta))
+    return EFFECT_VOLUME
 
 
 class MediaPlayer:
+    SPINNER = (
+        '[    ]',
+        '[=   ]',
+        '[==  ]',
+        '[=== ]',
+        '[ ===]',
+        '[  ==]',
+        '[   =]',
+        '[    ]',
+        '[   =]',
+        '[  ==]',
+        '[ ===]',
+        '[====]',
+        '[=== ]',
+        '[==  ]',
+        '[=   ]',
+    )
+
     def __init__(self, music_list):
         self.music_list = music_list
         self.music_list_num = 0
-        self.media = vlc.MediaPlayer(str(self.music_list[self.music_list_num]))
+        # One player for the whole session; tracks are swapped in with set_media()
+        self._default_media = _VLC_INSTANCE.media_new(
+            self.music_list[self.music_list_num]
+        )
+        self.media = _VLC_INSTANCE.media_player_new()
+        self.media.set_media(self._default_media)
         self.isloop = False
         self.yt_title = ''
         self.downloaddisplay = False
         self.youtubedisplay = False
         self.spinnerstate = 0
         self.isloading = False
-
-    def play_youtube(self, song_input: str, is_url: bool, tree_instance: Any) -> None:
-        self.downloaddisplay = True
-        if not is_internet_available():
-            tree_instance.notifyendtime = int(time.time()) + 5
-            tree_instance.notifystring = 'NO INTERNET CONNECTION'
-            tree_instance.isnotify = True
+        self._last_end_poll = 0.0
+        # (vlc.Media or None on failure, title or error message, notify seconds)
+        self.ready: queue.Queue[tuple[Any, str, int]] = queue.Queue()
+
+    def _resolve_youtube(self, song_input: str, is_url: bool) -> tuple[str, str]:
+        yt_url = song_input if is_url else get_youtube_links(song_input)
+        # Replays skip pytubefix's watch page and player JS decode entirely
+        match = URL_VIDEO_ID_REGEX.search(yt_url)
+        video_id = match.group(1) if match else yt_url
+        cached = _STREAM_CACHE.get(video_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+
+        yt = YouTube(yt_url)
+        streams = yt.streams
+        # Opus 251 when offered, otherwise the best audio-only stream there is
+        song_stream = (
+            streams.get_by_itag(251)
+            or streams.get_audio_only('webm')
+            or streams.get_audio_only()
+        )
+        song = song_stream.url if song_stream else None
+        if not song:
+            raise ValueError('No audio stream found for the video.')
+        _STREAM_CACHE[video_id] = (
+            time.monotonic() + STREAM_URL_TTL_SECS,
+            song,
+            yt.title,
+        )
+        return song, yt.title
+
+    def play_youtube(self, song_input: str, is_url: bool) -> None:
+        # Runs on the worker thread: resolve and build the media here, then hand
+        # the result to the UI thread through self.ready instead of touching state.
+        # No up-front connectivity probe: a failed request already tells us.
+        for attempt in range(YOUTUBE_ATTEMPTS):
+            if attempt:
+                time.sleep(YOUTUBE_BACKOFF_SECS * 2 ** (attempt - 1))
+            offline = False
+            try:
+                song, title = self._resolve_youtube(song_input, is_url)
+            except (requests.RequestException, URLError) as e:
+                # Network trouble is worth retrying. HTTPError is a URLError too,
+                # but it means the server did answer.
+                offline = isinstance(
+                    e, (requests.ConnectionError, URLError)
+                ) and not isinstance(e, HTTPError)
+                continue
+            except (PytubeFixError, KeyError, ValueError):
+                # Unavailable video or no audio stream: retrying will not help
+                break
+            except Exception:
+                logger.exception('Unexpected error resolving %r', song_input)
+                break
+            self.ready.put((_VLC_INSTANCE.media_new(song), title, 10))
             return
 
+        if offline:
+            self.ready.put((None, 'NO INTERNET CONNECTION', 5))
+        else:
+            self.ready.put((None, 'ERROR GETTING AUDIO, PLEASE TRY AGAIN', 5))
+
+    def poll_youtube(self, notifications: Any) -> None:
         try:
-            yt_url = song_input if is_url else get_youtube_links(song_input)
-            yt = YouTube(yt_url)
-            song_stream = yt.streams.get_by_itag(251)
-            song = song_stream.url if song_stream else None
-            if not song:
-                raise ValueError('No audio stream found for the video.')
-            self.media = vlc.MediaPlayer(song)
-            self.downloaddisplay = False
-            self.media.play()
-            self.yt_title = yt.title
-            tree_instance.notifications.notify('Playing: ' + self.yt_title, 10)
-        except Exception:
-            tree_instance.notifications.notify(
-                'ERROR GETTING AUDIO, PLEASE TRY AGAIN', 5
-            )
+            media, message, duration = self.ready.get_nowait()
+        except queue.Empty:
             return
 
-    def handle_media_end(self):
+        self.downloaddisplay = False
+        if media is not None:
+            self.media.set_media(media)
+            self.media.play()
+            self.yt_title = message
+            message = 'Playing: ' + self.yt_title
+        notifications.notify(message, duration)
+
+    def handle_media_end(self, now: float):
+        # The end-of-track check needs ~4 Hz, not one libVLC round trip per frame
+        if now - self._last_end_poll < 0.25:
+            return
+        self._last_end_poll = now
         if (
             self.media.is_playing()
             and self.media.get_length() - self.media.get_time() < 1000
@@ -110,32 +226,11 @@ class MediaPlayer:
                 self.media.set_position(0)
             else:
                 self.media.stop()
-                self.media = vlc.MediaPlayer(self.music_list[self.music_list_num])
+                self.media.set_media(self._default_media)
                 self.media.play()
 
     def show_loading_spinner(self, stdscr, maxx):
-        spinner = [
-            '[    ]',
-            '[=   ]',
-            '[==  ]',
-            '[=== ]',
-            '[ ===]',
-            '[  ==]',
-            '[   =]',
-            '[    ]',
-            '[   =]',
-            '[  ==]',
-            '[ ===]',
-            '[====]',
-            '[=== ]',
-            '[==  ]',
-            '[=   ]',
-        ]
-        self.spinnerstate += 0.5
-        if self.spinnerstate > len(spinner) - 1:
-            self.spinnerstate = 0
-
-        import curses
-
-        curses.textpad.rectangle(stdscr, 0, 0, 2, maxx - 1)  # type: ignore
-        stdscr.addstr(1, 1, 'GETTING AUDIO  ' + spinner[int(self.spinnerstate)])
+        self.spinnerstate = (self.spinnerstate + 0.5) % len(self.SPINNER)
+
+        curses.textpad.rectangle(stdscr, 0, 0, 2, maxx - 1)
+        stdscr.addstr(1, 1, 'GETTING AUDIO  ' + self.SPINNER[int(self.spinnerstate)])
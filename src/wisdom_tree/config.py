@@ -15,6 +15,14 @@ TIMER_BREAK_MINS = (5, 15, 10, 20)
 TIMER_WORK = tuple(t * 60 for t in TIMER_WORK_MINS)
 TIMER_BREAK = tuple(t * 60 for t in TIMER_BREAK_MINS)
 
+# Display settings
+FRAME_TIMEOUT_MS = 50  # Longest getch() wait per frame, i.e. the idle frame period
+
+# Media settings
+YOUTUBE_ATTEMPTS = 3  # Tries per YouTube request when the network hiccups
+YOUTUBE_BACKOFF_SECS = 0.5  # First retry delay, doubled on each further retry
+STREAM_URL_TTL_SECS = 5 * 60 * 60  # Signed stream URLs expire after about 6 hours
+
 # Sound settings
 SOUNDS_MUTED = False  # Only growth and start_timer are affected; alarm always plays
 TIMER_START_SOUND = str(RES_FOLDER / 'timerstart.wav')
@@ -1,18 +1,25 @@
 import curses
+import logging
 import os
+import queue
 import threading
 import time
+from collections.abc import Callable
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 from wisdom_tree.audio import (
     MediaPlayer,
+    adjust_effect_volume,
     adjust_media_volume,
     play_sound,
+    preload_sounds,
     toggle_sounds,
 )
 from wisdom_tree.config import (
-    EFFECT_VOLUME,
+    ALARM_SOUND,
+    FRAME_TIMEOUT_MS,
     GROWTH_SOUND,
     QUOTE_FILE_NAME,
     RES_FOLDER,
@@ -21,16 +28,42 @@ from wisdom_tree.config import (
 from wisdom_tree.timer import PomodoroTimer
 from wisdom_tree.tree import TreeManager
 from wisdom_tree.ui import (
+    BREAK_PROMPT_TEXT,
+    EXIT_PROMPT_TEXT,
+    PAUSED_TEXT,
+    Layout,
     MenuSystem,
     NotificationSystem,
     YouTubeInterface,
     add_animated_text,
+    build_layout,
     init_screen,
 )
-from wisdom_tree.utils import QuoteManager, StateManager, get_user_config_directory
+from wisdom_tree.utils import (
+    QuoteManager,
+    StateManager,
+    ensure_directory_exists,
+    get_user_config_directory,
+)
 
 os.environ['VLC_VERBOSE'] = '-1'
 
+# Key codes compared in the pause/break loops, resolved once at import
+KEY_SPACE = ord(' ')
+KEY_QUIT = ord('q')
+
+
+@lru_cache(maxsize=1)
+def _music_list() -> tuple[str, ...]:
+    # The bundled tracks never change while the app runs, so scan res/ once.
+    # Sorted for a stable default track; stored as str since VLC takes MRL strings.
+    return tuple(str(path) for path in sorted(RES_FOLDER.glob('*ogg')))
+
+
+def _format_media_time(ms: int) -> str:
+    mins, secs = divmod(max(0, ms // 1000), 60)
+    return f'{mins:02d}:{secs:02d}'
+
 
 class WisdomTreeApp:
     def __init__(self, stdscr: Any):
@@ -45,30 +78,41 @@ class WisdomTreeApp:
         self.notifications = NotificationSystem()
         self.youtube_interface = YouTubeInterface()
 
-        music_list = list(RES_FOLDER.glob('*ogg'))
-        self.media_player = MediaPlayer(music_list)
+        preload_sounds((GROWTH_SOUND, TIMER_START_SOUND, ALARM_SOUND))
+        self.media_player = MediaPlayer(_music_list())
         self.media_player.media.play()
 
         self.pause = False
-        self.pausetime = 0
+        self.pausetime = 0.0
+        self._drawn_frame: tuple | None = None
+        self.layout = build_layout(*stdscr.getmaxyx())
+
+        # One long-lived worker resolves YouTube requests off the UI thread
+        self.youtube_requests: queue.Queue[tuple[str, bool]] = queue.Queue()
+        threading.Thread(target=self._youtube_worker, daemon=True).start()
+
+    def _youtube_worker(self) -> None:
+        while True:
+            song_input, is_url = self.youtube_requests.get()
+            self.media_player.play_youtube(song_input, is_url)
+
+    def request_youtube(self, song_input: str, is_url: bool) -> None:
+        self.media_player.downloaddisplay = True
+        self.youtube_requests.put((song_input, is_url))
 
     def handle_pause(self) -> None:
         if self.media_player.media.is_playing():
             self.media_player.media.pause()
         self.pause = True
-        self.pausetime = time.time()
+        self.pausetime = time.monotonic()
 
     def handle_media_selection(self, index: int, maxx: int, stdscr: Any) -> None:
+        if index in (0, 1) and hasattr(self.media_player, 'media'):
+            self.media_player.media.stop()
         if index == 0:  # YouTube music
-            if hasattr(self.media_player, 'media'):
-                self.media_player.media.stop()
             self.youtube_interface.youtubedisplay = True
         elif index == 1:  # Concentration music
-            if hasattr(self.media_player, 'media'):
-                self.media_player.media.stop()
-            self.media_player.play_youtube(
-                'https://www.youtube.com/watch?v=oPVte6aMprI', True, self
-            )
+            self.request_youtube('https://www.youtube.com/watch?v=oPVte6aMprI', True)
 
     def handle_media_seek(self, offset: int, maxx: int) -> None:
         current_time = self.media_player.media.get_time()
@@ -76,41 +120,138 @@ class WisdomTreeApp:
 
         if offset > 0:
             if current_time + offset < length:
-                self.media_player.media.set_time(i_time=current_time + offset)
+                target = current_time + offset
             else:
-                self.media_player.media.set_time(length - 1)
+                target = length - 1
         else:
             if current_time + offset > 0:
-                self.media_player.media.set_time(i_time=current_time + offset)
+                target = current_time + offset
             else:
-                self.media_player.media.set_time(0)
+                target = 0
+        self.media_player.media.set_time(i_time=target)
 
-        time_sec = self.media_player.media.get_time() / 1000
-        display_time = f'{int(time_sec / 60):02d}:{int(time_sec) % 60:02d}'
-        try:
-            progress = (
-                self.media_player.media.get_time()
-                / self.media_player.media.get_length()
-            )
-            message = ' ' * (round(maxx * progress) - len(display_time)) + display_time
-            self.notifications.notify(message, invert=True)
-        except ZeroDivisionError:
-            pass
+        self.notifications.notify_bar(_format_media_time(target), target, length, maxx)
 
     def handle_media_position(self, position: float, maxx: int) -> None:
-        length = self.media_player.media.get_length()
-        self.media_player.media.set_time(i_time=int(length * position))
-        time_sec = self.media_player.media.get_time() / 1000
-        display_time = f'{int(time_sec / 60):02d}:{int(time_sec) % 60:02d}'
-        message = ' ' * (round(maxx * position) - len(display_time)) + display_time
-        self.notifications.notify(message, invert=True)
+        target = int(self.media_player.media.get_length() * position)
+        self.media_player.media.set_time(i_time=target)
+        self.notifications.notify_bar(_format_media_time(target), position, 1, maxx)
+
+    def _frame_key(
+        self, layout: Layout, quote: str, anilen: int, seconds: int, now: float
+    ) -> tuple | None:
+        # Everything the frame depends on; None forces a redraw (spinner, prompt)
+        if self.media_player.downloaddisplay or self.youtube_interface.youtubedisplay:
+            return None
+        return (
+            layout,
+            quote,
+            anilen,
+            self.tree_manager.render_key(seconds),
+            self.timer.get_remaining_work_time(now) if self.timer.istimer else None,
+            self.menu.render_key(now),
+            self.notifications.render_key(now),
+        )
+
+    def draw_frame(
+        self, layout: Layout, quote: str, anilen: int, seconds: int, now: float
+    ) -> None:
+        maxy, maxx = layout.maxy, layout.maxx
+        self.stdscr.erase()
+
+        # Display quote
+        add_animated_text(
+            layout.center_x, layout.quote_y, quote, anilen, self.stdscr, 2
+        )
+
+        # Display tree
+        self.tree_manager.display(self.stdscr, layout, seconds)
+
+        if self.timer.istimer:
+            self.timer.display_work_timer(self.stdscr, layout, now)
+
+        # Display menu
+        self.menu.display(self.stdscr, maxy, maxx, now)
+
+        # Handle YouTube interface
+        song_input = self.youtube_interface.show_input(self.stdscr, maxx)
+        if song_input:
+            is_url = self.youtube_interface.is_url(song_input)
+            self.request_youtube(song_input, is_url)
+
+        if self.media_player.downloaddisplay:
+            self.media_player.show_loading_spinner(self.stdscr, maxx)
+
+        # Show notifications
+        self.notifications.show(self.stdscr, maxy, maxx, now)
+
+    def _draw_overlay(self, frame_key: tuple, text: str, x: int, now: float) -> None:
+        # Overlays are static apart from the break countdown, so draw on change only
+        if frame_key == self._drawn_frame:
+            return
+        self._drawn_frame = frame_key
+        layout = self.layout
+        self.stdscr.erase()
+        self.stdscr.addstr(layout.overlay_y, x, text, curses.A_BOLD)
+        if self.timer.isbreak:
+            self.timer.display_break_timer(self.stdscr, layout, now)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def _wait_for_key(self, timeout_ms: int) -> int:
+        # Let curses block in read() instead of polling, then restore frame pacing
+        self.stdscr.timeout(timeout_ms)
+        try:
+            return self.stdscr.getch()
+        finally:
+            self.stdscr.timeout(FRAME_TIMEOUT_MS)
+
+    def overlay_step(self, now: float) -> None:
+        layout = self.layout
+        if self.pause:
+            self._draw_overlay((PAUSED_TEXT, layout), PAUSED_TEXT, layout.paused_x, now)
+            # Nothing changes while paused, so sleep in getch() until a key arrives
+            key = self._wait_for_key(-1)
+            if key == KEY_SPACE:
+                self.pause = False
+                self.media_player.media.play()
+                paused_for = time.monotonic() - self.pausetime
+                self.tree_manager.delay_growth(paused_for)
+                if self.timer.istimer:
+                    self.timer.workendtime += paused_for
+        else:
+            break_start = self.timer.breakendtime - self.timer.breaktime
+            if self.timer.update_break(now):
+                self.tree_manager.delay_growth(now - break_start)
+                self.media_player.media.play()
+                return
+            frame_key = (
+                BREAK_PROMPT_TEXT,
+                layout,
+                self.timer.get_remaining_break_time(now),
+            )
+            self._draw_overlay(frame_key, BREAK_PROMPT_TEXT, layout.break_prompt_x, now)
+            # Only wake when the countdown ticks over to its next second
+            until_tick = (self.timer.breakendtime - now) % 1
+            key = self._wait_for_key(int(until_tick * 1000) + 1)
+            if key == KEY_SPACE:
+                self.tree_manager.delay_growth(time.monotonic() - break_start)
+                self.timer.end_break_early(self.media_player.media)
+
+        if key == KEY_QUIT:
+            self.save_and_exit()
+        elif key == curses.KEY_RESIZE:
+            self.handle_resize()
+
+    def handle_resize(self) -> None:
+        # The terminal size only changes with a KEY_RESIZE, so it is queried here
+        self.layout = build_layout(*self.stdscr.getmaxyx())
 
     def save_and_exit(self) -> None:
         self.state_manager.save_tree_age(self.tree_manager.get_age())
         exit()
 
     def run_main_loop(self) -> None:
-        seconds = 5
         anilen = 1
         anispeed = 1
 
@@ -119,116 +260,60 @@ class WisdomTreeApp:
 
         try:
             while True:
-                start = time.time()
+                # Sample the clock once; every per-frame deadline check uses it
+                now = time.monotonic()
+                # Animation clock in 1/100 s, so weather speed is frame-rate independent
+                seconds = int(now * 100)
 
+                layout = self.layout
                 try:
-                    self.stdscr.erase()
-                    maxy, maxx = self.stdscr.getmaxyx()
+                    # Pause and break swap the scene for a prompt until space
+                    if self.pause or self.timer.isbreak:
+                        self.overlay_step(now)
+                        continue
 
-                    # Display quote
-                    add_animated_text(
-                        int(maxx / 2), int(maxy * 5 / 6), quote, anilen, self.stdscr, 2
-                    )
-                    anilen += anispeed
-                    if anilen > 150:
-                        anilen = 150
+                    maxx = layout.maxx
 
                     # Update quote and tree growth every 10 minutes
-                    if seconds % (100 * 60 * 10) == 0:
+                    if self.tree_manager.growth_due(now):
                         quote = self.quote_manager.get_random_quote()
                         self.tree_manager.tree.grow()
                         anilen = 1
                         play_sound(GROWTH_SOUND)
 
-                    # Display tree
-                    self.tree_manager.display(self.stdscr, maxx, maxy, seconds)
-
-                    # Display timer if active
-                    self.timer.display_work_timer(self.stdscr, maxy, maxx)
-
-                    # Display menu
-                    self.menu.display(self.stdscr, maxy, maxx)
-
-                    # Handle YouTube interface
-                    song_input = self.youtube_interface.show_input(self.stdscr, maxx)
-                    if song_input:
-                        is_url = self.youtube_interface.is_url(song_input)
-                        thread = threading.Thread(
-                            target=self.media_player.play_youtube,
-                            args=(song_input, is_url, self),
-                        )
-                        thread.daemon = True
-                        thread.start()
-
-                    if self.media_player.downloaddisplay:
-                        self.media_player.show_loading_spinner(self.stdscr, maxx)
+                    # Advance the timer only while one is running
+                    if self.timer.istimer:
+                        self.timer.update(self.media_player.media, now)
 
-                    # Update timer
-                    self.timer.update(self.media_player.media)
+                    # Start playback of a track resolved by the worker
+                    self.media_player.poll_youtube(self.notifications)
 
                     # Handle media end
-                    self.media_player.handle_media_end()
+                    self.media_player.handle_media_end(now)
 
-                    # Show notifications
-                    self.notifications.show(self.stdscr, maxy, maxx)
+                    # Redraw only when something on screen actually changed
+                    frame_key = self._frame_key(layout, quote, anilen, seconds, now)
+                    if frame_key is None or frame_key != self._drawn_frame:
+                        self._drawn_frame = frame_key
+                        self.draw_frame(layout, quote, anilen, seconds, now)
+                        # One terminal update per drawn frame
+                        self.stdscr.noutrefresh()
+                        curses.doupdate()
+
+                    # Once saturated, anilen stops changing and so does the frame key
+                    anilen = min(anilen + anispeed, 150)
 
                     # Handle input
                     key_events(self.stdscr, self, maxx)
 
-                    # Handle pause state
-                    while self.pause:
-                        self.stdscr.erase()
-                        self.stdscr.addstr(
-                            int(maxy * 3 / 5),
-                            int(maxx / 2 - len('PAUSED') / 2),
-                            'PAUSED',
-                            curses.A_BOLD,
-                        )
-                        key = self.stdscr.getch()
-                        if key == ord(' '):
-                            self.pause = False
-                            self.media_player.media.play()
-                            self.stdscr.refresh()
-                            if self.timer.istimer:
-                                self.timer.workendtime += time.time() - self.pausetime
-                        if key == ord('q'):
-                            self.save_and_exit()
-                        time.sleep(0.1)
-
-                    # Handle break state
-                    while self.timer.isbreak:
-                        self.stdscr.erase()
-                        self.stdscr.addstr(
-                            int(maxy * 3 / 5),
-                            int(maxx / 2 - len('PRESS SPACE TO END BREAK') / 2),
-                            'PRESS SPACE TO END BREAK',
-                            curses.A_BOLD,
-                        )
-                        break_ended = self.timer.display_break_timer(
-                            self.stdscr, maxy, maxx
-                        )
-                        if break_ended:
-                            self.media_player.media.play()
-
-                        self.stdscr.refresh()
-                        key = self.stdscr.getch()
-
-                        if key == ord(' '):
-                            self.timer.end_break_early(self.media_player.media)
-                        if key == ord('q'):
-                            self.save_and_exit()
-                        time.sleep(0.1)
-
-                    time.sleep(max(0.05 - (time.time() - start), 0))
-                    seconds += 5
-
                 except KeyboardInterrupt:
+                    self._drawn_frame = None
                     try:
                         self.stdscr.erase()
                         self.stdscr.addstr(
-                            int(maxy * 3 / 5),
-                            int(maxx / 2 - len("PRESS 'q' TO EXIT") / 2),
-                            "PRESS 'q' TO EXIT",
+                            layout.overlay_y,
+                            layout.exit_prompt_x,
+                            EXIT_PROMPT_TEXT,
                             curses.A_BOLD,
                         )
                         self.stdscr.refresh()
@@ -236,85 +321,91 @@ class WisdomTreeApp:
                     except KeyboardInterrupt:
                         pass
 
-                self.stdscr.refresh()
-
         finally:
             curses.echo()
             curses.nocbreak()
             curses.curs_set(1)
             self.stdscr.keypad(False)
-            self.stdscr.nodelay(False)
+            self.stdscr.timeout(-1)
             curses.endwin()
 
 
+KeyHandler = Callable[[WisdomTreeApp, Any, int], None]
+
+
+def _select_menu_item(app: WisdomTreeApp, stdscr: Any, maxx: int) -> None:
+    main_item, sub_index = app.menu.select()
+    if main_item == 'POMODORO TIMER':
+        app.timer.start_timer(sub_index, stdscr, maxx)
+        play_sound(TIMER_START_SOUND)
+    elif main_item == 'MEDIA':
+        app.handle_media_selection(sub_index, maxx, stdscr)
+        play_sound(TIMER_START_SOUND)
+    app.menu.show_sub_menu = False
+
+
+def _change_media_volume(
+    delta: int, app: WisdomTreeApp, stdscr: Any, maxx: int
+) -> None:
+    new_volume = app.media_player.media.audio_get_volume() + delta
+    adjust_media_volume(app, new_volume, maxx)
+
+
+def _change_effect_volume(
+    delta: int, app: WisdomTreeApp, stdscr: Any, maxx: int
+) -> None:
+    volume = adjust_effect_volume(delta)
+    app.notifications.notify_bar(f'Effects: {volume}%', volume, 100, maxx)
+
+
+def _toggle_repeat(app: WisdomTreeApp, stdscr: Any, maxx: int) -> None:
+    app.media_player.isloop = not app.media_player.isloop
+    app.notifications.notify(f'REPEAT: {app.media_player.isloop}')
+
+
+def _seek_by(offset: int, app: WisdomTreeApp, stdscr: Any, maxx: int) -> None:
+    app.handle_media_seek(offset, maxx)
+
+
+def _seek_to(position: float, app: WisdomTreeApp, stdscr: Any, maxx: int) -> None:
+    app.handle_media_position(position, maxx)
+
+
+# Built once at import: one dict lookup per keypress instead of an if-chain
+_KEY_HANDLERS: dict[int, KeyHandler] = {
+    curses.KEY_UP: lambda app, stdscr, maxx: app.menu.navigate_up(),
+    ord('k'): lambda app, stdscr, maxx: app.menu.navigate_up(),
+    curses.KEY_DOWN: lambda app, stdscr, maxx: app.menu.navigate_down(),
+    ord('j'): lambda app, stdscr, maxx: app.menu.navigate_down(),
+    curses.KEY_RIGHT: lambda app, stdscr, maxx: app.menu.navigate_right(),
+    ord('l'): lambda app, stdscr, maxx: app.menu.navigate_right(),
+    curses.KEY_LEFT: lambda app, stdscr, maxx: app.menu.navigate_left(),
+    ord('h'): lambda app, stdscr, maxx: app.menu.navigate_left(),
+    27: lambda app, stdscr, maxx: app.menu.navigate_left(),
+    curses.KEY_ENTER: _select_menu_item,
+    10: _select_menu_item,
+    13: _select_menu_item,
+    curses.KEY_RESIZE: lambda app, stdscr, maxx: app.handle_resize(),
+    KEY_QUIT: lambda app, stdscr, maxx: app.save_and_exit(),
+    ord('u'): lambda app, stdscr, maxx: toggle_sounds(),
+    KEY_SPACE: lambda app, stdscr, maxx: app.handle_pause(),
+    ord('m'): lambda app, stdscr, maxx: app.media_player.media.pause(),
+    ord(']'): partial(_change_media_volume, 1),
+    ord('['): partial(_change_media_volume, -1),
+    ord('}'): partial(_change_effect_volume, 1),
+    ord('{'): partial(_change_effect_volume, -1),
+    ord('='): partial(_seek_by, 10000),
+    ord('-'): partial(_seek_by, -10000),
+    ord('r'): _toggle_repeat,
+    **{ord(str(i)): partial(_seek_to, i / 10) for i in range(10)},
+}
+
+
 def key_events(stdscr: Any, app: WisdomTreeApp, maxx: int) -> None:
-    global EFFECT_VOLUME
     key = stdscr.getch()
-
-    # Update menu activity timestamp on navigation keys
-    if key in (
-        curses.KEY_UP,
-        ord('k'),
-        curses.KEY_DOWN,
-        ord('j'),
-        curses.KEY_RIGHT,
-        ord('l'),
-        curses.KEY_LEFT,
-        ord('h'),
-        27,
-    ):
-        app.menu.menu_last_active = time.time()
-
-    # Menu navigation
-    if key in (curses.KEY_UP, ord('k')):
-        app.menu.navigate_up()
-    elif key in (curses.KEY_DOWN, ord('j')):
-        app.menu.navigate_down()
-    elif key in (curses.KEY_RIGHT, ord('l')):
-        app.menu.navigate_right()
-    elif key in (curses.KEY_LEFT, ord('h'), 27):
-        app.menu.navigate_left()
-    elif key == curses.KEY_ENTER or key in [10, 13]:
-        main_item, sub_index = app.menu.select()
-        if main_item == 'POMODORO TIMER':
-            app.timer.start_timer(sub_index, stdscr, maxx)
-            play_sound(TIMER_START_SOUND)
-        elif main_item == 'MEDIA':
-            app.handle_media_selection(sub_index, maxx, stdscr)
-            play_sound(TIMER_START_SOUND)
-        app.menu.show_sub_menu = False
-
-    # Application controls
-    if key == ord('q'):
-        app.save_and_exit()
-    if key == ord('u'):
-        toggle_sounds()
-    if key == ord(' '):
-        app.handle_pause()
-    if key == ord('m'):
-        app.media_player.media.pause()
-    if key == ord(']'):
-        new_volume = app.media_player.media.audio_get_volume() + 1
-        adjust_media_volume(app, new_volume, maxx)
-    if key == ord('['):
-        new_volume = app.media_player.media.audio_get_volume() - 1
-        adjust_media_volume(app, new_volume, maxx)
-    if key == ord('}'):
-        EFFECT_VOLUME = min(100, EFFECT_VOLUME + 1)
-        app.notifications.notify(f'Effects: {EFFECT_VOLUME}%', invert=True)
-    if key == ord('{'):
-        EFFECT_VOLUME = max(0, EFFECT_VOLUME - 1)
-        app.notifications.notify(f'Effects: {EFFECT_VOLUME}%', invert=True)
-    if key == ord('='):
-        app.handle_media_seek(10000, maxx)
-    if key == ord('-'):
-        app.handle_media_seek(-10000, maxx)
-    if key == ord('r'):
-        app.media_player.isloop = not app.media_player.isloop
-        app.notifications.notify(f'REPEAT: {app.media_player.isloop}')
-    for i in range(10):
-        if key == ord(str(i)):
-            app.handle_media_position(i / 10, maxx)
+    handler = _KEY_HANDLERS.get(key)
+    if handler is not None:
+        handler(app, stdscr, maxx)
 
 
 def main(stdscr: Any) -> None:
@@ -323,9 +414,24 @@ def main(stdscr: Any) -> None:
     app.run_main_loop()
 
 
+def _configure_logging(config_dir: Path) -> None:
+    # Never log to the terminal: stderr output would tear through the curses screen
+    try:
+        ensure_directory_exists(config_dir)
+        logging.basicConfig(
+            filename=config_dir / 'wisdom-tree.log',
+            level=logging.WARNING,
+            format='%(asctime)s %(name)s %(levelname)s: %(message)s',
+        )
+    except OSError:
+        logging.getLogger().addHandler(logging.NullHandler())
+
+
 def run():
     """Entry point for the CLI command."""
-    config_file = Path(get_user_config_directory()) / 'wisdom-tree' / QUOTE_FILE_NAME
+    config_dir = Path(get_user_config_directory()) / 'wisdom-tree'
+    _configure_logging(config_dir)
+    config_file = config_dir / QUOTE_FILE_NAME
     if config_file.exists():
         # Note: This would need to be handled differently in the new structure
         pass
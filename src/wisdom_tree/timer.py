@@ -1,38 +1,48 @@
 import curses
+import math
 import time
 from typing import Any
 
 from wisdom_tree.audio import play_sound
-from wisdom_tree.config import ALARM_SOUND, TIMER_BREAK, TIMER_WORK
+from wisdom_tree.config import ALARM_SOUND, FRAME_TIMEOUT_MS, TIMER_BREAK, TIMER_WORK
+from wisdom_tree.ui import COLOR_PAIRS, Layout
 
 
 class PomodoroTimer:
+    WORK_LABEL = 'WORK: '
+    BREAK_LABEL = 'Break ends in: '
+    BREAK_OVER_TEXT = 'BREAK IS OVER, PRESS ENTER TO START NEW TIMER'
+    TIMER_OVER_TEXT = 'TIMER IS OVER, PRESS ENTER'
+
     def __init__(self):
         self.istimer = False
         self.isbreak = False
         self.breakover = False
         self.worktime = 0
         self.breaktime = 0
-        self.workendtime = 0
-        self.breakendtime = 0
-        self.pausetime = 0
-        self.pause = False
-        self.breakendtext = 'BREAK IS OVER, PRESS ENTER TO START NEW TIMER'
+        # Deadlines are time.monotonic() values so wall-clock jumps cannot skew them
+        self.workendtime = 0.0
+        self.breakendtime = 0.0
+        self._work_text = ''
+        self._work_text_secs = -1
+        self._break_text = ''
+        self._break_text_secs: int | None = None
+        self.breakendtext = self.BREAK_OVER_TEXT
 
     def start_timer(self, timer_index: int, stdscr: Any, maxx: int) -> None:
         if timer_index == 5:  # END TIMER NOW
-            self.breakendtext = 'TIMER IS OVER, PRESS ENTER'
+            self.breakendtext = self.TIMER_OVER_TEXT
             self.worktime = 0
             self.breaktime = 0
             self.istimer = False
         elif timer_index == 4:  # CUSTOM TIMER
             self._handle_custom_timer(stdscr, maxx)
         else:  # Preset timers
-            self.breakendtext = 'BREAK IS OVER, PRESS ENTER TO START NEW TIMER'
+            self.breakendtext = self.BREAK_OVER_TEXT
             self.istimer = True
             self.worktime = TIMER_WORK[timer_index]
             self.breaktime = TIMER_BREAK[timer_index]
-            self.workendtime = int(time.time()) + self.worktime
+            self.workendtime = time.monotonic() + self.worktime
 
     def _handle_custom_timer(self, stdscr: Any, maxx: int) -> None:
         try:
@@ -42,7 +52,7 @@ class PomodoroTimer:
 
             curses.echo()
             curses.nocbreak()
-            stdscr.nodelay(False)
+            stdscr.timeout(-1)
             stdscr.keypad(False)
             curses.curs_set(1)
 
@@ -56,7 +66,7 @@ class PomodoroTimer:
 
             self._restore_screen_settings(stdscr)
             self.istimer = True
-            self.workendtime = int(time.time()) + self.worktime
+            self.workendtime = time.monotonic() + self.worktime
 
         except ValueError:
             self._restore_screen_settings(stdscr)
@@ -66,12 +76,12 @@ class PomodoroTimer:
     def _restore_screen_settings(self, stdscr: Any) -> None:
         curses.noecho()
         curses.cbreak()
-        stdscr.nodelay(True)
+        stdscr.timeout(FRAME_TIMEOUT_MS)
         stdscr.keypad(True)
         curses.curs_set(0)
 
-    def update(self, media_player: Any) -> None:
-        if self.istimer and int(time.time()) >= int(self.workendtime):
+    def update(self, media_player: Any, now: float) -> None:
+        if self.istimer and now >= self.workendtime:
             self.start_break(media_player)
 
     def start_break(self, media_player: Any) -> None:
@@ -79,66 +89,57 @@ class PomodoroTimer:
             play_sound(ALARM_SOUND)
             if media_player.is_playing():
                 media_player.pause()
-            self.breakendtime = int(time.time()) + self.breaktime
+            self.breakendtime = time.monotonic() + self.breaktime
             self.istimer = False
             self.isbreak = True
 
-    def display_work_timer(self, stdscr: Any, maxy: int, maxx: int) -> None:
+    def display_work_timer(self, stdscr: Any, layout: Layout, now: float) -> None:
         if self.istimer:
-            remaining = max(0, int(self.workendtime - time.time()))
-            timer_text = f'WORK: {remaining // 60:02d}:{remaining % 60:02d}'
+            remaining = max(0, math.ceil(self.workendtime - now))
+            if remaining != self._work_text_secs:
+                mins, secs = divmod(remaining, 60)
+                self._work_text = f'{self.WORK_LABEL}{mins:02d}:{secs:02d}'
+                self._work_text_secs = remaining
+            timer_text = self._work_text
             stdscr.addstr(
-                int(maxy * 10 / 11),
-                int(maxx / 2 - len(timer_text) // 2),
+                layout.timer_y,
+                int(layout.maxx / 2 - len(timer_text) // 2),
                 timer_text,
-                curses.color_pair(1),
+                COLOR_PAIRS[1],
             )
 
-    def display_break_timer(self, stdscr: Any, maxy: int, maxx: int) -> bool:
+    def update_break(self, now: float) -> bool:
+        # True on the frame the break runs out
+        if self.isbreak and now >= self.breakendtime:
+            self.isbreak = False
+            self.breakover = True
+            play_sound(ALARM_SOUND)
+            return True
+        return False
+
+    def display_break_timer(self, stdscr: Any, layout: Layout, now: float) -> None:
         if self.isbreak:
-            seconds_left = int(self.breakendtime) - int(time.time())
-            timer_text = (
-                'Break ends in: '
-                + str(int(seconds_left / 60)).zfill(2)
-                + ':'
-                + str(seconds_left % 60).zfill(2)
-            )
+            seconds_left = math.ceil(self.breakendtime - now)
+            if seconds_left != self._break_text_secs:
+                mins, secs = divmod(max(0, seconds_left), 60)
+                self._break_text = f'{self.BREAK_LABEL}{mins:02d}:{secs:02d}'
+                self._break_text_secs = seconds_left
+            timer_text = self._break_text
             stdscr.addstr(
-                int(maxy * 10 / 11), int(maxx / 2 - len(timer_text) / 2), timer_text
+                layout.timer_y, int(layout.maxx / 2 - len(timer_text) / 2), timer_text
             )
 
-            if seconds_left <= 0:
-                self.isbreak = False
-                self.breakover = True
-                play_sound(ALARM_SOUND)
-                return True
-        return False
-
-    def handle_pause(self, media_player: Any) -> None:
-        if not self.pause:
-            return
-
-        if media_player.is_playing():
-            media_player.pause()
-        self.pausetime = time.time()
-
-    def resume_from_pause(self, media_player: Any) -> None:
-        self.pause = False
-        media_player.play()
-        if self.istimer:
-            self.workendtime += time.time() - self.pausetime
-
     def end_break_early(self, media_player: Any) -> None:
         if self.isbreak:
             self.isbreak = False
             media_player.play()
 
-    def get_remaining_work_time(self) -> int:
+    def get_remaining_work_time(self, now: float) -> int:
         if self.istimer:
-            return max(0, int(self.workendtime - time.time()))
+            return max(0, math.ceil(self.workendtime - now))
         return 0
 
-    def get_remaining_break_time(self) -> int:
+    def get_remaining_break_time(self, now: float) -> int:
         if self.isbreak:
-            return max(0, int(self.breakendtime - time.time()))
+            return max(0, math.ceil(self.breakendtime - now))
         return 0
@@ -1,49 +1,61 @@
-import curses
+import bisect
 import random
 import time
 from typing import Any
 
 from wisdom_tree.config import RES_FOLDER
-from wisdom_tree.ui import add_animated_text, print_art
+from wisdom_tree.ui import (
+    COLOR_PAIRS,
+    Layout,
+    add_animated_text,
+    art_layout,
+    preload_art,
+    print_art,
+)
+
+# Minimum tree age for each growth stage p1.txt .. p9.txt
+ART_STAGE_AGES = (1, 5, 10, 20, 30, 40, 70, 120, 200)
+ART_STAGE_FILES = tuple(
+    str(RES_FOLDER / f'p{stage}.txt') for stage in range(1, len(ART_STAGE_AGES) + 1)
+)
+
+# season: (intensity, speed, char, color_pair)
+WEATHER_PARAMS = {
+    'rain': (30, 30, '/', 4),
+    'light_rain': (30, 60, '`', 4),
+    'heavy_rain': (40, 20, '/', 4),
+    'snow': (30, 30, '.', 5),
+    'windy': (20, 30, '-', 4),
+}
 
 
 class TreeDisplay:
     def __init__(self, age: int = 1):
         self.age = age
         self.artfile = ''
-        random.seed(int(time.time() / (60 * 60 * 24)))
-        self.season = random.choice(
-            ['rain', 'heavy_rain', 'light_rain', 'snow', 'windy']
-        )
-        random.seed()
+        self.age_label = ''
+        self._rendered_age: int | None = None
+        rng = random.Random(int(time.time() / (60 * 60 * 24)))
+        self.season = rng.choice(['rain', 'heavy_rain', 'light_rain', 'snow', 'windy'])
 
     def get_art_file(self) -> str:
-        if self.age >= 1 and self.age < 5:
-            return str(RES_FOLDER / 'p1.txt')
-        elif self.age >= 5 and self.age < 10:
-            return str(RES_FOLDER / 'p2.txt')
-        elif self.age >= 10 and self.age < 20:
-            return str(RES_FOLDER / 'p3.txt')
-        elif self.age >= 20 and self.age < 30:
-            return str(RES_FOLDER / 'p4.txt')
-        elif self.age >= 30 and self.age < 40:
-            return str(RES_FOLDER / 'p5.txt')
-        elif self.age >= 40 and self.age < 70:
-            return str(RES_FOLDER / 'p6.txt')
-        elif self.age >= 70 and self.age < 120:
-            return str(RES_FOLDER / 'p7.txt')
-        elif self.age >= 120 and self.age < 200:
-            return str(RES_FOLDER / 'p8.txt')
-        else:  # age >= 200
-            return str(RES_FOLDER / 'p9.txt')
-
-    def display(self, stdscr: Any, maxx: int, maxy: int) -> None:
-        self.artfile = self.get_art_file()
-        print_art(stdscr, self.artfile, int(maxx / 2), int(maxy * 3 / 4), 1)
+        # Ages below the first threshold wrap to the last stage, as before.
+        return ART_STAGE_FILES[bisect.bisect_right(ART_STAGE_AGES, self.age) - 1]
+
+    def _refresh_render_state(self) -> None:
+        # Art file and label only depend on age, which rarely changes.
+        if self._rendered_age != self.age:
+            self.artfile = self.get_art_file()
+            self.age_label = 'age: ' + str(int(self.age)) + ' '
+            self._rendered_age = self.age
+
+    def display(self, stdscr: Any, layout: Layout, x: int, y: int) -> None:
+        self._refresh_render_state()
+        print_art(stdscr, self.artfile, layout, x, y, 1)
         add_animated_text(
-            int(maxx / 2),
-            int(maxy * 3 / 4),
-            'age: ' + str(int(self.age)) + ' ',
+            x,
+            y,
+            self.age_label,
             -1,
             stdscr,
             3,
@@ -59,6 +71,50 @@ class TreeDisplay:
 class SeasonalEffects:
     def __init__(self, season: str):
         self.season = season
+        self.weather = WEATHER_PARAMS.get(season)
+        self._drops_key: tuple[int, int, int, int] | None = None
+        self._drop_runs: dict[int, list[tuple[int, str]]] = {}
+
+    def _generate_drops(
+        self,
+        maxx: int,
+        maxy: int,
+        seconds: int,
+        intensity: int,
+        speed: int,
+        art: tuple[tuple[str, ...], int, int],
+    ) -> dict[int, list[int]]:
+        rng = random.Random(int(seconds / speed))
+        art_lines, art_left, art_top = art
+
+        drops: dict[int, list[int]] = {}
+        rows = rng.choices(range(int(maxy * 1 / 4), int(maxy * 3 / 4)), k=intensity)
+        cols = rng.choices(range(int(maxx / 3), int(maxx * 2 / 3)), k=intensity)
+        for ry, rx in zip(rows, cols, strict=True):
+            # Drops fall behind the tree: never stamp over an art glyph
+            # (slicing is C-level and yields '' past the end of the line)
+            row, col = ry - art_top, rx - art_left
+            if 0 <= row < len(art_lines) and col >= 0:
+                if art_lines[row][col : col + 1].strip():
+                    continue
+            drops.setdefault(ry, []).append(rx)
+
+        for cols in drops.values():
+            cols.sort()
+        return drops
+
+    @staticmethod
+    def _coalesce_runs(cols: list[int], char: str) -> list[tuple[int, str]]:
+        # Adjacent drops on a row become one (start column, text) run
+        runs: list[tuple[int, str]] = []
+        start = prev = cols[0]
+        for col in cols[1:]:
+            if col > prev + 1:
+                runs.append((start, char * (prev - start + 1)))
+                start = col
+            prev = col
+        runs.append((start, char * (prev - start + 1)))
+        return runs
 
     def render_rain(
         self,
@@ -70,52 +126,69 @@ class SeasonalEffects:
         speed: int,
         char: str,
         color_pair: int,
+        art: tuple[tuple[str, ...], int, int] = ((), 0, 0),
     ) -> None:
-        random.seed(int(seconds / speed))
-
-        for _i in range(intensity):
-            ry = random.randrange(int(maxy * 1 / 4), int(maxy * 3 / 4))
-            rx = random.randrange(int(maxx / 3), int(maxx * 2 / 3))
-            stdscr.addstr(ry, rx, char, curses.color_pair(color_pair))
-
-        random.seed()
-
-    def render(self, stdscr: Any, maxx: int, maxy: int, seconds: int) -> None:
-        if self.season == 'rain':
-            self.render_rain(stdscr, maxx, maxy, seconds, 30, 30, '/', 4)
-        elif self.season == 'light_rain':
-            self.render_rain(stdscr, maxx, maxy, seconds, 30, 60, '`', 4)
-        elif self.season == 'heavy_rain':
-            self.render_rain(stdscr, maxx, maxy, seconds, 40, 20, '/', 4)
-        elif self.season == 'snow':
-            self.render_rain(stdscr, maxx, maxy, seconds, 30, 30, '.', 5)
-        elif self.season == 'windy':
-            self.render_rain(stdscr, maxx, maxy, seconds, 20, 30, '-', 4)
+        # Drops only move when the time bucket rolls over, the screen resizes
+        # or the tree grows into a new art stage.
+        key = (int(seconds / speed), maxx, maxy, id(art[0]))
+        if key != self._drops_key:
+            drops = self._generate_drops(maxx, maxy, seconds, intensity, speed, art)
+            self._drop_runs = {
+                ry: self._coalesce_runs(cols, char) for ry, cols in drops.items()
+            }
+            self._drops_key = key
+        attr = COLOR_PAIRS[color_pair]
+        for ry, runs in self._drop_runs.items():
+            for rx, text in runs:
+                stdscr.addstr(ry, rx, text, attr)
+
+    def render_key(self, seconds: int) -> int | None:
+        # The weather frame only changes when its time bucket rolls over
+        return int(seconds / self.weather[1]) if self.weather is not None else None
+
+    def render(
+        self,
+        stdscr: Any,
+        maxx: int,
+        maxy: int,
+        seconds: int,
+        art: tuple[tuple[str, ...], int, int] = ((), 0, 0),
+    ) -> None:
+        if self.weather is not None:
+            self.render_rain(stdscr, maxx, maxy, seconds, *self.weather, art=art)
 
 
 class TreeManager:
     def __init__(self, initial_age: int = 1):
+        # Read every growth stage up front so drawing never touches the disk
+        preload_art(ART_STAGE_FILES)
         self.tree = TreeDisplay(initial_age)
         self.effects = SeasonalEffects(self.tree.season)
-        self.last_growth = time.time()
         self.growth_interval = 600  # 10 minutes
+        self.next_growth = time.monotonic() + self.growth_interval
 
-    def update(self, quote_changed: bool = False) -> None:
-        if quote_changed:
-            self.tree.grow()
+    def growth_due(self, now: float) -> bool:
+        # now is a time.monotonic() sample; re-arms the deadline when it fires
+        if now < self.next_growth:
+            return False
+        self.next_growth = now + self.growth_interval
+        return True
 
-    def display(self, stdscr: Any, maxx: int, maxy: int, seconds: int) -> None:
-        self.tree.display(stdscr, maxx, maxy)
-        self.effects.render(stdscr, maxx, maxy, seconds)
+    def delay_growth(self, seconds: float) -> None:
+        # Time spent paused or on a break does not count towards growth
+        self.next_growth += seconds
 
-    def get_age(self) -> int:
-        return int(self.tree.age)
+    def render_key(self, seconds: int) -> tuple[int, int | None]:
+        return self.tree.age, self.effects.render_key(seconds)
 
-    def set_age(self, age: int) -> None:
-        self.tree.set_age(age)
+    def display(self, stdscr: Any, layout: Layout, seconds: int) -> None:
+        x, y = layout.center_x, layout.art_y
+        self.tree.display(stdscr, layout, x, y)
+        art = art_layout(self.tree.artfile, x, y)
+        self.effects.render(stdscr, layout.maxx, layout.maxy, seconds, art)
 
-    def save_age(self) -> int:
+    def get_age(self) -> int:
         return int(self.tree.age)
 
-    def load_age(self, age: int) -> None:
+    def set_age(self, age: int) -> None:
         self.tree.set_age(age)
@@ -2,49 +2,140 @@ import curses
 import curses.textpad
 import re
 import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from wisdom_tree.config import TIMER_BREAK_MINS, TIMER_WORK_MINS
+from wisdom_tree.config import FRAME_TIMEOUT_MS, TIMER_BREAK_MINS, TIMER_WORK_MINS
+
+# Attributes for color pairs 0-7, filled in by init_colors()
+COLOR_PAIRS: list[int] = []
+
+# (art file, color pair) -> (pad, rows, cols), built lazily once curses is running
+_ART_PADS: dict[tuple[str, int], tuple[Any, int, int]] = {}
 
 YOUTUBE_REGEX = re.compile(r'^(https?\:\/\/)?(www\.)?(youtube\.com|youtu\.be)\/.+$')
 
+# (pair, foreground, background) on terminals with 256 colors
+EXTENDED_COLOR_PAIRS = (
+    (1, 113, -1),
+    (2, 85, -1),
+    (3, 3, -1),
+    (4, 51, -1),
+    (5, 15, -1),
+    (6, 1, -1),
+    (7, curses.COLOR_YELLOW, -1),
+)
+
+PAUSED_TEXT = 'PAUSED'
+BREAK_PROMPT_TEXT = 'PRESS SPACE TO END BREAK'
+EXIT_PROMPT_TEXT = "PRESS 'q' TO EXIT"
+_PAUSED_HALF = len(PAUSED_TEXT) / 2
+_BREAK_PROMPT_HALF = len(BREAK_PROMPT_TEXT) / 2
+_EXIT_PROMPT_HALF = len(EXIT_PROMPT_TEXT) / 2
+
+
+@dataclass(slots=True, frozen=True)
+class Layout:
+    maxy: int
+    maxx: int
+    center_x: int
+    quote_y: int
+    overlay_y: int
+    art_y: int
+    timer_y: int
+    paused_x: int
+    break_prompt_x: int
+    exit_prompt_x: int
+
+
+@lru_cache(maxsize=1)
+def build_layout(maxy: int, maxx: int) -> Layout:
+    # Screen coordinates only change on resize (KEY_RESIZE rebuilds the app's copy)
+    return Layout(
+        maxy,
+        maxx,
+        int(maxx / 2),
+        int(maxy * 5 / 6),
+        int(maxy * 3 / 5),
+        int(maxy * 3 / 4),
+        int(maxy * 10 / 11),
+        int(maxx / 2 - _PAUSED_HALF),
+        int(maxx / 2 - _BREAK_PROMPT_HALF),
+        int(maxx / 2 - _EXIT_PROMPT_HALF),
+    )
+
 
 def replace_nth(s: str, source: str, target: str, n: int) -> str:
-    inds = [
-        i for i in range(len(s) - len(source) + 1) if s[i : i + len(source)] == source
-    ]
-    if len(inds) < n:
-        return s
-    s_list = list(s)
-    s_list[inds[n - 1] : inds[n - 1] + len(source)] = target
-    return ''.join(s_list)
+    idx = -1
+    for _ in range(n):
+        idx = s.find(source, idx + 1)
+        if idx < 0:
+            return s
+    return s[:idx] + target + s[idx + len(source) :]
+
+
+@lru_cache(maxsize=256)
+def _animated_lines(text: str, anilen: int) -> tuple[tuple[str, float], ...]:
+    # (line, half width) per wrapped line; a quote only has ~150 distinct prefixes
+    text = replace_nth(text[: int(anilen)], ' ', '#', 10)
+    return tuple((line, len(line) / 2) for line in text.split('#'))
 
 
 def add_animated_text(
     x: int, y: int, text: str, anilen: int, stdscr: Any, color_pair: int
 ) -> None:
-    text = replace_nth(text[: int(anilen)], ' ', '#', 10)
-    text_list = text.split('#')
-    for i in range(len(text_list)):
-        stdscr.addstr(
-            y + i,
-            int(x - len(text_list[i]) / 2),
-            str(text_list[i]),
-            curses.color_pair(color_pair),
-        )
+    attr = COLOR_PAIRS[color_pair]
+    for i, (line, half_width) in enumerate(_animated_lines(text, anilen)):
+        stdscr.addstr(y + i, int(x - half_width), line, attr)
 
 
-def print_art(stdscr: Any, file_path: str, x: int, y: int, color_pair: int) -> None:
+@lru_cache(maxsize=16)
+def _load_art(file_path: str) -> tuple[tuple[str, ...], int]:
+    # Art files never change at runtime, so read each one and measure it only once.
     with open(file_path, encoding='utf8') as f:
-        lines = f.readlines()
+        lines = tuple(f.readlines())
+    return lines, int(len(max(lines, key=len)) / 2)
+
+
+def preload_art(file_paths: Iterable[str]) -> None:
+    for file_path in file_paths:
+        _load_art(file_path)
+
+
+def art_layout(file_path: str, x: int, y: int) -> tuple[tuple[str, ...], int, int]:
+    lines, half_width = _load_art(file_path)
+    return lines, x - half_width, y - len(lines)
+
+
+def _art_pad(file_path: str, color_pair: int) -> tuple[Any, int, int]:
+    # Rasterize each art stage into an off-screen pad once; frames just blit it.
+    key = (file_path, color_pair)
+    if key not in _ART_PADS:
+        lines = [line.rstrip('\n') for line in _load_art(file_path)[0]]
+        rows, cols = len(lines), max(1, max(len(line) for line in lines))
+        # One spare column so writing the last cell never runs off the pad
+        pad = curses.newpad(rows, cols + 1)
+        for i, line in enumerate(lines):
+            pad.addstr(i, 0, line, COLOR_PAIRS[color_pair])
+        _ART_PADS[key] = (pad, rows, cols)
+    return _ART_PADS[key]
+
+
+def print_art(
+    stdscr: Any, file_path: str, layout: Layout, x: int, y: int, color_pair: int
+) -> None:
+    _lines, left, top = art_layout(file_path, x, y)
+    pad, rows, cols = _art_pad(file_path, color_pair)
 
-    for i in range(len(lines)):
-        stdscr.addstr(
-            y + i - len(lines),
-            x - int(len(max(lines, key=len)) / 2),
-            lines[i],
-            curses.color_pair(color_pair),
-        )
+    maxy, maxx = layout.maxy, layout.maxx
+    bottom, right = min(top + rows, maxy) - 1, min(left + cols, maxx) - 1
+    if bottom < max(top, 0) or right < max(left, 0):
+        return
+    pad.overwrite(
+        stdscr, max(-top, 0), max(-left, 0), max(top, 0), max(left, 0), bottom, right
+    )
 
 
 class MenuSystem:
@@ -61,13 +152,17 @@ class MenuSystem:
             ],
             'MEDIA': [' PLAY MUSIC FROM YOUTUBE ', ' ~CONCENTRATION MUSIC '],
         }
+        self._sub_menu_widths = {
+            name: max(len(item) for item in items)
+            for name, items in self.sub_menus.items()
+        }
         self.current_main_index = 0
         self.current_sub_index = 0
         self.show_sub_menu = False
-        self.menu_last_active = time.time()
+        self.menu_last_active = time.monotonic()
 
-    def display(self, stdscr: Any, maxy: int, maxx: int) -> None:
-        if time.time() - self.menu_last_active < 5:
+    def display(self, stdscr: Any, maxy: int, maxx: int, now: float) -> None:
+        if now - self.menu_last_active < 5:
             start_y = int(maxy / 2) - len(self.main_menu)
             for idx, item in enumerate(self.main_menu):
                 style = (
@@ -78,10 +173,10 @@ class MenuSystem:
                 stdscr.addstr(start_y + idx * 2, 2, item, style)
 
             if self.show_sub_menu:
-                submenu_items = self.sub_menus[self.main_menu[self.current_main_index]]
+                current_main = self.main_menu[self.current_main_index]
+                submenu_items = self.sub_menus[current_main]
                 submenu_start_y = start_y
-                max_item_len = max(len(item) for item in submenu_items)
-                submenu_x = maxx - max_item_len - 2
+                submenu_x = maxx - self._sub_menu_widths[current_main] - 2
                 for idx, item in enumerate(submenu_items):
                     style = (
                         curses.A_REVERSE
@@ -90,36 +185,36 @@ class MenuSystem:
                     )
                     stdscr.addstr(submenu_start_y + idx * 2, submenu_x, item, style)
 
-    def navigate_up(self) -> None:
-        self.menu_last_active = time.time()
+    def render_key(self, now: float) -> tuple[int, int, bool] | None:
+        if now - self.menu_last_active < 5:
+            return self.current_main_index, self.current_sub_index, self.show_sub_menu
+        return None
+
+    def _move(self, delta: int) -> None:
+        self.menu_last_active = time.monotonic()
         if self.show_sub_menu:
-            self.current_sub_index = (self.current_sub_index - 1) % len(
+            self.current_sub_index = (self.current_sub_index + delta) % len(
                 self.sub_menus[self.main_menu[self.current_main_index]]
             )
         else:
-            self.current_main_index = (self.current_main_index - 1) % len(
+            self.current_main_index = (self.current_main_index + delta) % len(
                 self.main_menu
             )
 
+    def navigate_up(self) -> None:
+        self._move(-1)
+
     def navigate_down(self) -> None:
-        self.menu_last_active = time.time()
-        if self.show_sub_menu:
-            self.current_sub_index = (self.current_sub_index + 1) % len(
-                self.sub_menus[self.main_menu[self.current_main_index]]
-            )
-        else:
-            self.current_main_index = (self.current_main_index + 1) % len(
-                self.main_menu
-            )
+        self._move(1)
 
     def navigate_right(self) -> None:
-        self.menu_last_active = time.time()
+        self.menu_last_active = time.monotonic()
         if not self.show_sub_menu:
             self.show_sub_menu = True
             self.current_sub_index = 0
 
     def navigate_left(self) -> None:
-        self.menu_last_active = time.time()
+        self.menu_last_active = time.monotonic()
         self.show_sub_menu = False
 
     def select(self) -> tuple[str, int]:
@@ -136,8 +231,8 @@ class NotificationSystem:
         self.notifystring = ' '
         self.invert = False
 
-    def show(self, stdscr: Any, maxy: int, maxx: int) -> None:
-        if self.isnotify and time.time() <= self.notifyendtime:
+    def show(self, stdscr: Any, maxy: int, maxx: int, now: float) -> None:
+        if self.isnotify and now <= self.notifyendtime:
             curses.textpad.rectangle(stdscr, 0, 0, 2, maxx - 1)
             if self.invert:
                 stdscr.addstr(
@@ -149,8 +244,19 @@ class NotificationSystem:
             else:
                 stdscr.addstr(1, 1, self.notifystring[: maxx - 2], curses.A_BOLD)
 
+    def render_key(self, now: float) -> tuple[str, bool] | None:
+        if self.isnotify and now <= self.notifyendtime:
+            return self.notifystring, self.invert
+        return None
+
+    def notify_bar(self, label: str, value: float, total: float, maxx: int) -> None:
+        # Right-align label at value/total of the width, kept inside the box
+        ratio = value / total if total > 0 else 0
+        pad = max(0, min(round(maxx * ratio), maxx - 2) - len(label))
+        self.notify(' ' * pad + label, invert=True)
+
     def notify(self, message: str, duration: int = 2, invert: bool = False) -> None:
-        self.notifyendtime = int(time.time()) + duration
+        self.notifyendtime = time.monotonic() + duration
         self.notifystring = message
         self.invert = invert
         self.isnotify = True
@@ -169,7 +275,7 @@ class YouTubeInterface:
 
             curses.echo()
             curses.nocbreak()
-            stdscr.nodelay(False)
+            stdscr.timeout(-1)
             stdscr.keypad(False)
             curses.curs_set(1)
 
@@ -177,7 +283,7 @@ class YouTubeInterface:
 
             curses.noecho()
             curses.cbreak()
-            stdscr.nodelay(True)
+            stdscr.timeout(FRAME_TIMEOUT_MS)
             stdscr.keypad(True)
             curses.curs_set(0)
 
@@ -195,29 +301,23 @@ class YouTubeInterface:
 
 
 def init_colors() -> None:
-    curses.start_color()
-    curses.use_default_colors()
-
-    try:
-        curses.init_pair(1, 113, -1)
-        curses.init_pair(2, 85, -1)
-        curses.init_pair(3, 3, -1)
-        curses.init_pair(4, 51, -1)
-        curses.init_pair(5, 15, -1)
-        curses.init_pair(6, 1, -1)
-        curses.init_pair(7, curses.COLOR_YELLOW, -1)
-    except Exception:
-        curses.init_pair(1, 1, 0)
-        curses.init_pair(2, 1, 0)
-        curses.init_pair(3, 1, 0)
-        curses.init_pair(4, 1, 0)
-        curses.init_pair(5, 1, 0)
-        curses.init_pair(6, 1, 0)
-        curses.init_pair(7, 1, 0)
+    if curses.has_colors():
+        curses.start_color()
+        curses.use_default_colors()
+        # The palette needs 256 colors; smaller terminals get the plain fallback
+        if curses.COLORS >= 256:
+            pairs = EXTENDED_COLOR_PAIRS
+        else:
+            pairs = tuple((pair, 1, 0) for pair in range(1, 8))
+        for pair, fg, bg in pairs:
+            curses.init_pair(pair, fg, bg)
+
+    COLOR_PAIRS[:] = [curses.color_pair(i) for i in range(8)]
 
 
 def init_screen(stdscr: Any) -> None:
-    stdscr.nodelay(True)
+    # getch() waits up to one frame for input, which also paces the main loop
+    stdscr.timeout(FRAME_TIMEOUT_MS)
     stdscr.keypad(True)
     curses.curs_set(0)
     curses.noecho()
@@ -1,10 +1,15 @@
+import itertools
+import logging
 import os
 import pickle
 import random
+from collections.abc import Iterator
 from pathlib import Path
 
 from wisdom_tree.config import QUOTE_FILE
 
+logger = logging.getLogger(__name__)
+
 
 def get_user_config_directory() -> str:
     if os.name == 'nt':
@@ -25,6 +30,7 @@ def get_user_config_directory() -> str:
 class QuoteManager:
     def __init__(self):
         self.quotes_cache = self._load_quotes()
+        self._quote_cycle = self._shuffled_cycle()
 
     def _load_quotes(self) -> list[str]:
         try:
@@ -33,13 +39,20 @@ class QuoteManager:
         except Exception:
             return []
 
+    def _shuffled_cycle(self) -> Iterator[str]:
+        # Shuffle once and walk the deck, so no quote repeats until all were shown
+        quotes = list(self.quotes_cache)
+        random.shuffle(quotes)
+        return itertools.cycle(quotes)
+
     def get_random_quote(self) -> str:
         if not self.quotes_cache:
             return 'Keep growing, keep learning.'
-        return random.choice(self.quotes_cache)
+        return next(self._quote_cycle)
 
     def reload_quotes(self) -> None:
         self.quotes_cache = self._load_quotes()
+        self._quote_cycle = self._shuffled_cycle()
 
 
 class StateManager:
@@ -48,15 +61,17 @@ class StateManager:
 
     def save_tree_age(self, age: int) -> None:
         try:
-            with open(self.state_file, 'wb') as f:
-                pickle.dump(age, f, protocol=None)
+            self.state_file.write_bytes(age.to_bytes(4, 'little'))
         except Exception as e:
-            print(f'Error saving tree age: {e}')
+            logger.warning('Error saving tree age: %s', e)
 
     def load_tree_age(self) -> int:
         try:
-            with open(self.state_file, 'rb') as f:
-                return pickle.load(f)
+            data = self.state_file.read_bytes()
+            if len(data) == 4:
+                return int.from_bytes(data, 'little')
+            # Older versions pickled the age; it is rewritten as raw bytes on exit
+            return pickle.loads(data)
         except Exception:
             return 1
 